@@ -0,0 +1,68 @@
+"""
+Benchmark de memoria de los mapas de IDs MySQL → ObjectId
+Compara un dict {int: ObjectId} con el MapaIds compacto de la migración
+(array('q') de claves + bytearray de ObjectIds empaquetados).
+
+Uso: python benchmark_mapas_ids.py [cantidad_de_ids]
+"""
+
+import sys
+import time
+import tracemalloc
+from bson.objectid import ObjectId
+
+from migracion_mysql_a_mongodb import MapaIds
+
+CANTIDAD = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+REPETIDAS = 1_000
+
+def medir(nombre, construir):
+    """Memoria retenida por la estructura y tiempo de construcción y búsqueda"""
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    mapa = construir()
+    construccion = time.perf_counter() - inicio
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Cada clave una vez (referencias a clientes) y claves repetidas
+    # (los mismos productos en muchos detalles)
+    inicio = time.perf_counter()
+    for id_mysql in range(1, CANTIDAD + 1, 7):
+        mapa[id_mysql]
+    busquedas = len(range(1, CANTIDAD + 1, 7))
+    busqueda = (time.perf_counter() - inicio) / busquedas
+
+    repetidas = [id_mysql for _ in range(100) for id_mysql in range(1, min(CANTIDAD, REPETIDAS) + 1)]
+    inicio = time.perf_counter()
+    for id_mysql in repetidas:
+        mapa[id_mysql]
+    repetida = (time.perf_counter() - inicio) / len(repetidas)
+
+    print(f"{nombre:<22}{memoria / 1024 / 1024:>10.1f} MB{memoria / CANTIDAD:>10.1f} B/id"
+          f"{construccion:>10.2f} s{busqueda * 1e9:>10.0f} ns{repetida * 1e9:>10.0f} ns")
+    return memoria
+
+def construir_dict():
+    mapa = {}
+    for id_mysql in range(1, CANTIDAD + 1):
+        mapa[id_mysql] = ObjectId()
+    return mapa
+
+def construir_compacto():
+    mapa = MapaIds('Benchmark')
+    for id_mysql in range(1, CANTIDAD + 1):
+        mapa.asignar(id_mysql)
+    return mapa
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print(f"📏 MAPAS DE IDS: {CANTIDAD:,} claves")
+    print("=" * 80)
+    print(f"{'estructura':<22}{'memoria':>13}{'por id':>15}{'construir':>12}{'búsqueda':>12}{'repetida':>12}")
+
+    memoria_dict = medir("dict de ObjectId", construir_dict)
+    memoria_compacto = medir("MapaIds", construir_compacto)
+
+    print("=" * 80)
+    print(f"✅ MapaIds usa {memoria_dict / memoria_compacto:.1f}x menos memoria")
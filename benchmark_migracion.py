@@ -0,0 +1,400 @@
+"""
+Benchmark de extremo a extremo de migracion_mysql_a_mongodb.py
+Ejecuta migrar() sin MySQL: el origen es una copia SQLite de Schema_Fixed.sql
+(tablas, índices y datos de prueba) llenada con datos sintéticos, y el
+destino un MongoDB local (o mongomock en memoria con --mongo memoria).
+
+Por cada tamaño se generan `compras` filas de Compra con 1-4 DetalleCompra
+cada una (2.5 de media), factura para el 95%, devoluciones de ~2% de los
+detalles, y clientes, citas, exámenes, asesores y productos en proporción.
+Las bases generadas se guardan en --datos y se reutilizan, así dos versiones
+del migrador se comparan sobre los mismos datos.
+
+Reporta por etapa (métricas de la migración más el muestreo de RSS):
+tiempo, filas/s, documentos/s y pico de RSS del proceso y sus procesos de
+particiones. Con --salida guarda todos los resultados en JSON.
+
+Las opciones MIGRACION_* del entorno (o .env) se aplican igual que en la
+migración real; la base MongoDB de destino es optica_benchmark. Con mongomock
+la verificación por digests (agregaciones en Python) domina el tiempo total:
+MIGRACION_VERIFICAR=false la omite.
+
+Uso: python benchmark_migracion.py [compras ...] [--mongo URI|memoria]
+                                   [--datos DIR] [--salida archivo.json]
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import migracion_mysql_a_mongodb as migracion
+
+TAMANOS = [10_000, 100_000, 1_000_000]
+MONGO = 'mongodb://localhost:27017/'
+BASE_MONGO = 'optica_benchmark'
+DATOS = 'benchmark_datos'
+ESQUEMA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Schema_Fixed.sql')
+SEMILLA = 7
+INTERVALO_RSS = 0.05
+
+# Por cada compra
+CLIENTES_POR_COMPRA = 0.1
+CITAS_POR_COMPRA = 0.25
+EXAMENES_POR_CITA = 0.5
+DEVOLUCIONES_POR_DETALLE = 0.02
+FACTURAS_POR_COMPRA = 0.95
+# Por cada mil compras (mínimo los de Schema_Fixed.sql)
+ASESORES_POR_MIL = 0.5
+PRODUCTOS_POR_MIL = 2
+
+# ============================================================================
+# ORIGEN SQLITE (en lugar de MySQL)
+# ============================================================================
+
+def _hora(valor):
+    horas, minutos, segundos = valor.decode().split(':')
+    return timedelta(hours=int(horas), minutes=int(minutos), seconds=float(segundos))
+
+# Mismos tipos Python que devuelve mysql.connector
+sqlite3.register_converter('DATE', lambda v: date.fromisoformat(v.decode()))
+sqlite3.register_converter('DATETIME', lambda v: datetime.fromisoformat(v.decode()))
+sqlite3.register_converter('TIMESTAMP', lambda v: datetime.fromisoformat(v.decode()))
+sqlite3.register_converter('TIME', _hora)
+sqlite3.register_converter('DECIMAL', lambda v: Decimal(v.decode()))
+
+def _date_format(valor, formato):
+    """DATE_FORMAT de MySQL para los formatos de fecha y hora comunes"""
+    if valor is None:
+        return None
+    formato = formato.replace('%i', '%M').replace('%s', '%S')
+    return datetime.fromisoformat(str(valor)).strftime(formato)
+
+class CursorSQLite:
+    """Lo que la migración usa de un cursor de mysql.connector"""
+
+    def __init__(self, conexion, diccionario):
+        self._cursor = conexion.cursor()
+        self._diccionario = diccionario
+
+    def execute(self, query, params=()):
+        self._cursor.execute(query.replace('%s', '?'), tuple(params or ()))
+
+    def fetchmany(self, tamano=1):
+        filas = self._cursor.fetchmany(tamano)
+        if not self._diccionario or not filas:
+            return filas
+        columnas = [d[0] for d in self._cursor.description]
+        return [dict(zip(columnas, fila)) for fila in filas]
+
+    def close(self):
+        self._cursor.close()
+
+class ConexionSQLite:
+    """Conexión con la interfaz de mysql.connector sobre un archivo SQLite"""
+
+    def __init__(self, ruta):
+        # La extracción puede leer el cursor desde otro hilo (MIGRACION_ASYNCIO)
+        self._conexion = sqlite3.connect(ruta, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False)
+        self._conexion.create_function('DATE_FORMAT', 2, _date_format)
+
+    def cursor(self, dictionary=False, buffered=None):
+        return CursorSQLite(self._conexion, dictionary)
+
+    def consume_results(self):
+        pass
+
+    def close(self):
+        self._conexion.close()
+
+def esquema_sqlite(ruta=ESQUEMA):
+    """
+    Traduce Schema_Fixed.sql a SQLite: tablas e INSERTs de prueba, con los
+    índices declarados y los que InnoDB crea para cada FOREIGN KEY (sin
+    ellos los filtros y ORDER BY por FK serían recorridos completos).
+    Las vistas (CURDATE, etc.) se omiten.
+    """
+    with open(ruta, encoding='utf-8') as archivo:
+        sql = archivo.read()
+    sql = re.sub(r'CREATE DATABASE[^;]*;|USE [^;]*;|CREATE (OR REPLACE )?VIEW .*?;', '', sql, flags=re.S)
+    sql = re.sub(r'\)\s*ENGINE=[^;]*;', ');', sql)
+    sql = sql.replace('INT AUTO_INCREMENT PRIMARY KEY', 'INTEGER PRIMARY KEY')
+    sql = re.sub(r'\bTRUE\b', '1', sql)
+    sql = re.sub(r'\bFALSE\b', '0', sql)
+
+    indices = []
+    def sin_indices(tabla):
+        nombre, cuerpo = tabla.group(1), tabla.group(2)
+        columnas = re.findall(r'INDEX \w+ \(([^)]*)\)', cuerpo) + re.findall(r'FOREIGN KEY \(([^)]*)\)', cuerpo)
+        for columna in dict.fromkeys(c.strip() for c in columnas):
+            sufijo = re.sub(r'\W+', '_', columna)
+            indices.append(f"CREATE INDEX idx_{nombre}_{sufijo} ON {nombre} ({columna});")
+        cuerpo = re.sub(r',\s*INDEX \w+ \([^)]*\)', '', cuerpo)
+        return f"CREATE TABLE {nombre} ({cuerpo});"
+    sql = re.sub(r'CREATE TABLE (\w+) \((.*?)\);', sin_indices, sql, flags=re.S)
+    return sql + '\n' + '\n'.join(indices)
+
+# ============================================================================
+# DATOS SINTÉTICOS
+# ============================================================================
+
+def _siguiente_id(db, tabla, clave):
+    return db.execute(f"SELECT COALESCE(MAX({clave}), 0) + 1 FROM {tabla}").fetchone()[0]
+
+def _ids(db, tabla, clave):
+    return [f[0] for f in db.execute(f"SELECT {clave} FROM {tabla}")]
+
+def _insertar(db, tabla, columnas, filas):
+    marcas = ', '.join('?' * len(columnas))
+    db.executemany(f"INSERT INTO {tabla} ({', '.join(columnas)}) VALUES ({marcas})", filas)
+
+def generar_base(ruta, compras, semilla=SEMILLA):
+    """Crea en `ruta` la base SQLite con Schema_Fixed.sql y `compras` compras sintéticas"""
+    rnd = random.Random(semilla)
+    temporal = ruta + '.tmp'
+    if os.path.exists(temporal):
+        os.remove(temporal)
+    db = sqlite3.connect(temporal)
+    db.executescript(esquema_sqlite())
+    inicio = datetime(2023, 1, 1)
+    dia = lambda n: inicio + timedelta(days=n % 1095)
+
+    # Entidades
+    desde = _siguiente_id(db, 'Asesor', 'id_asesor')
+    _insertar(db, 'Asesor', ['id_asesor', 'nombre', 'apellido', 'numero_documento', 'fecha_contratacion'], [
+        (i, f'Asesor{i}', f'Apellido{i}', f'AS{i:08d}', dia(i).date().isoformat())
+        for i in range(desde, int(compras * ASESORES_POR_MIL / 1000) + 1)
+    ])
+    tipos_producto = _ids(db, 'TipoProducto', 'id_tipo')
+    desde = _siguiente_id(db, 'Producto', 'id_producto')
+    _insertar(db, 'Producto', ['id_producto', 'nombre_producto', 'id_tipo', 'marca', 'precio_venta', 'stock',
+                               'codigo_barras'], [
+        (i, f'Producto {i}', rnd.choice(tipos_producto), f'Marca{i % 40}', rnd.randint(20, 900) * 1000,
+         rnd.randint(0, 200), f'BM{i:011d}')
+        for i in range(desde, int(compras * PRODUCTOS_POR_MIL / 1000) + 1)
+    ])
+    precios = dict(db.execute("SELECT id_producto, precio_venta FROM Producto"))
+    productos = list(precios)
+
+    desde = _siguiente_id(db, 'Cliente', 'id_cliente')
+    hasta = max(int(compras * CLIENTES_POR_COMPRA), desde)
+    clientes = range(desde, hasta + 1)
+    _insertar(db, 'Cliente', ['id_cliente', 'nombre', 'apellido', 'email', 'fecha_nacimiento', 'numero_documento',
+                              'tipo_documento', 'fecha_registro'], [
+        (i, f'Nombre{i}', f'Apellido{i}', f'cliente{i}@benchmark.test', f'{1950 + i % 55}-{1 + i % 12:02d}-15',
+         f'CC{i:010d}', 'CC', dia(i).isoformat(sep=' '))
+        for i in clientes
+    ])
+    _insertar(db, 'DireccionCliente', ['id_cliente', 'calle', 'ciudad', 'estado', 'pais', 'es_principal'], [
+        (i, f'Calle {i % 200} #{i % 90}-{i % 70}', ciudad, estado, 'Colombia', int(n == 0))
+        for i in clientes
+        for n, (ciudad, estado) in enumerate([('Bogotá', 'Cundinamarca'), ('Medellín', 'Antioquia')][:rnd.randint(1, 2)])
+    ])
+    _insertar(db, 'TelefonoCliente', ['id_cliente', 'telefono', 'es_principal'],
+              [(i, f'3{i:09d}', 1) for i in clientes])
+    clientes = _ids(db, 'Cliente', 'id_cliente')
+    asesores = _ids(db, 'Asesor', 'id_asesor')
+    especialistas = _ids(db, 'Especialista', 'id_especialista')
+    metodos = _ids(db, 'MetodoPago', 'id_metodo')
+    motivos = _ids(db, 'Motivo', 'id_motivo')
+
+    # Clínica
+    desde = _siguiente_id(db, 'Cita', 'id_cita')
+    citas = range(desde, desde + int(compras * CITAS_POR_COMPRA))
+    _insertar(db, 'Cita', ['id_cita', 'fecha_cita', 'hora_cita', 'id_motivo', 'id_cliente', 'id_asesor',
+                           'id_especialista', 'estado'], [
+        (i, dia(i).date().isoformat(), f'{8 + i % 10:02d}:{i % 4 * 15:02d}:00', rnd.choice(motivos),
+         rnd.choice(clientes), rnd.choice(asesores), rnd.choice(especialistas),
+         rnd.choice(['Programada', 'Confirmada', 'Completada', 'Cancelada']))
+        for i in citas
+    ])
+    desde = _siguiente_id(db, 'ExamenVista', 'id_examen')
+    _insertar(db, 'ExamenVista', ['id_examen', 'fecha_examen', 'agudeza_visual_od', 'esfera_od', 'cilindro_od',
+                                  'eje_od', 'agudeza_visual_oi', 'esfera_oi', 'cilindro_oi', 'eje_oi',
+                                  'distancia_pupilar', 'id_cliente', 'id_especialista', 'id_cita'], [
+        (desde + n, dia(id_cita).isoformat(sep=' '), '20/20', rnd.randint(-24, 8) / 4, rnd.randint(-8, 0) / 4,
+         rnd.randint(0, 180), '20/25', rnd.randint(-24, 8) / 4, rnd.randint(-8, 0) / 4, rnd.randint(0, 180),
+         rnd.randint(560, 700) / 10, rnd.choice(clientes), rnd.choice(especialistas), id_cita)
+        for n, id_cita in enumerate(citas[::int(1 / EXAMENES_POR_CITA)])
+    ])
+
+    # Ventas, por bloques para no tener los detalles de todas las compras en memoria
+    id_compra = _siguiente_id(db, 'Compra', 'id_compra')
+    id_detalle = _siguiente_id(db, 'DetalleCompra', 'id_detalle')
+    id_factura = _siguiente_id(db, 'Factura', 'id_factura')
+    id_devolucion = _siguiente_id(db, 'Devolucion', 'id_devolucion')
+    for bloque in range(0, compras, 50_000):
+        ventas, detalles, facturas, devoluciones = [], [], [], []
+        for _ in range(min(50_000, compras - bloque)):
+            fecha = (dia(id_compra // 100) + timedelta(minutes=id_compra % 600)).isoformat(sep=' ')
+            subtotal = 0
+            for _ in range(rnd.randint(1, 4)):
+                producto, cantidad = rnd.choice(productos), rnd.randint(1, 3)
+                total = precios[producto] * cantidad
+                subtotal += total
+                detalles.append((id_detalle, id_compra, producto, cantidad, precios[producto], total, 0, total))
+                if rnd.random() < DEVOLUCIONES_POR_DETALLE:
+                    devoluciones.append((id_devolucion, id_compra, id_detalle, fecha[:10], 1, 'Defecto de fábrica',
+                                         rnd.choice(['Pendiente', 'Aprobada', 'Reembolsada']),
+                                         precios[producto], rnd.choice(asesores)))
+                    id_devolucion += 1
+                id_detalle += 1
+            ventas.append((id_compra, fecha, rnd.choice(metodos), rnd.choice(clientes), rnd.choice(asesores),
+                           subtotal, 0, round(subtotal * 0.19, 2), round(subtotal * 1.19, 2), 'Completada'))
+            if rnd.random() < FACTURAS_POR_COMPRA:
+                facturas.append((id_factura, f'FB-{id_factura:09d}', fecha, id_compra))
+                id_factura += 1
+            id_compra += 1
+        _insertar(db, 'Compra', ['id_compra', 'fecha_compra', 'id_metodo', 'id_cliente', 'id_asesor', 'subtotal',
+                                 'descuento', 'impuesto', 'total', 'estado'], ventas)
+        _insertar(db, 'DetalleCompra', ['id_detalle', 'id_compra', 'id_producto', 'cantidad', 'precio_unitario',
+                                        'subtotal', 'descuento', 'total'], detalles)
+        _insertar(db, 'Factura', ['id_factura', 'numero_factura', 'fecha_factura', 'id_compra'], facturas)
+        _insertar(db, 'Devolucion', ['id_devolucion', 'id_compra', 'id_detalle', 'fecha_devolucion',
+                                     'cantidad_devuelta', 'motivo', 'estado', 'monto_reembolso', 'id_asesor'],
+                  devoluciones)
+    db.commit()
+    db.close()
+    os.replace(temporal, ruta)
+
+def preparar_base(compras, directorio):
+    """Ruta de la base SQLite de `compras` compras, generándola si no existe"""
+    os.makedirs(directorio, exist_ok=True)
+    ruta = os.path.join(directorio, f'optica_{compras}.sqlite')
+    if os.path.exists(ruta):
+        print(f"📂 Reutilizando {ruta}")
+        return ruta
+    print(f"📦 Generando {compras:,} compras sintéticas en {ruta}...")
+    inicio = time.perf_counter()
+    generar_base(ruta, compras)
+    print(f"📦 Base generada en {time.perf_counter() - inicio:.1f}s")
+    return ruta
+
+# Los procesos de particiones (spawn) importan este módulo como __mp_main__:
+# la variable de entorno les indica qué base SQLite abrir en vez de MySQL
+if os.getenv('BENCHMARK_SQLITE'):
+    migracion.conectar_mysql = lambda mostrar=True: ConexionSQLite(os.environ['BENCHMARK_SQLITE'])
+
+# ============================================================================
+# MEDICIÓN
+# ============================================================================
+
+def rss(pid='self'):
+    """RSS en bytes de un proceso y sus descendientes (Linux, vía /proc); None si no se puede leer"""
+    try:
+        with open(f'/proc/{pid}/status') as archivo:
+            total = next(int(l.split()[1]) * 1024 for l in archivo if l.startswith('VmRSS:'))
+        for tarea in os.listdir(f'/proc/{pid}/task'):
+            with open(f'/proc/{pid}/task/{tarea}/children') as archivo:
+                total += sum(rss(hijo) or 0 for hijo in archivo.read().split())
+        return total
+    except (OSError, StopIteration):
+        return None
+
+class MuestreoRss(threading.Thread):
+    """Muestrea el RSS cada INTERVALO_RSS y guarda el pico de cada etapa en curso"""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.picos = {}
+        self.pico_total = 0
+        self._detener = threading.Event()
+
+    def run(self):
+        while not self._detener.wait(INTERVALO_RSS):
+            actual = rss()
+            if actual is None:
+                return
+            self.pico_total = max(self.pico_total, actual)
+            for nombre, metricas in list(migracion._metricas_etapas.items()):
+                if metricas.estado == 'en_curso':
+                    self.picos[nombre] = max(self.picos.get(nombre, 0), actual)
+
+    def detener(self):
+        self._detener.set()
+        self.join()
+
+def conectar_mongo(destino):
+    """Devuelve la función conectar_mongodb para el benchmark"""
+    if destino != 'memoria':
+        migracion.MONGODB_URI = destino
+        migracion.MONGODB_DATABASE = BASE_MONGO
+        return migracion.conectar_mongodb
+    import mongomock
+    # Un solo cliente: todas las conexiones deben ver los mismos datos
+    db = mongomock.MongoClient()[BASE_MONGO]
+    migracion.AsyncMongoClient = None
+    return lambda: db
+
+def medir(compras, ruta, destino):
+    """Ejecuta migrar() sobre la base SQLite `ruta`; devuelve el resultado de la medición"""
+    os.environ['BENCHMARK_SQLITE'] = ruta
+    migracion.conectar_mysql = lambda mostrar=True: ConexionSQLite(ruta)
+    migracion.conectar_mongodb = conectar_mongo(destino)
+    muestreo = MuestreoRss()
+    muestreo.start()
+    inicio = time.perf_counter()
+    try:
+        migracion.migrar()
+    finally:
+        segundos = time.perf_counter() - inicio
+        muestreo.detener()
+    etapas = [m.a_dict() for m in migracion._metricas_etapas.values()]
+    for etapa in etapas:
+        # None: la etapa duró menos que el intervalo de muestreo
+        pico = muestreo.picos.get(etapa['etapa'])
+        etapa['rss_pico_mb'] = round(pico / 1024 / 1024, 1) if pico else None
+    return {
+        'compras': compras,
+        'segundos': round(segundos, 3),
+        'rss_pico_mb': round(muestreo.pico_total / 1024 / 1024, 1),
+        'etapas': sorted(etapas, key=lambda e: e['segundos'], reverse=True),
+    }
+
+def imprimir(resultado):
+    print("\n" + "=" * 80)
+    print(f"⏱️  MIGRACIÓN DE {resultado['compras']:,} COMPRAS: {resultado['segundos']:.2f}s, "
+          f"pico RSS {resultado['rss_pico_mb']:,.0f} MB")
+    print("=" * 80)
+    print(f"{'etapa':<15}{'tiempo':>10}{'filas':>12}{'filas/s':>11}{'docs':>11}{'docs/s':>10}{'RSS MB':>9}")
+    for e in resultado['etapas']:
+        rss_etapa = f"{e['rss_pico_mb']:,.0f}" if e['rss_pico_mb'] is not None else '—'
+        print(f"{e['etapa']:<15}{e['segundos']:>9.2f}s{e['filas']:>12,}{e['filas_por_s']:>11,.0f}"
+              f"{e['documentos']:>11,}{e['docs_por_s']:>10,.0f}{rss_etapa:>9}")
+
+if __name__ == "__main__":
+    argumentos = sys.argv[1:]
+    opciones = {'--mongo': MONGO, '--datos': DATOS, '--salida': None}
+    for opcion in opciones:
+        if opcion in argumentos:
+            posicion = argumentos.index(opcion)
+            opciones[opcion] = argumentos[posicion + 1]
+            del argumentos[posicion:posicion + 2]
+    tamanos = [int(a) for a in argumentos] or TAMANOS
+    # El reporte de cada migración lo reemplaza el resultado del benchmark
+    migracion.REPORTE_METRICAS = ''
+
+    resultados = []
+    for compras in tamanos:
+        ruta = preparar_base(compras, opciones['--datos'])
+        resultados.append(medir(compras, ruta, opciones['--mongo']))
+        imprimir(resultados[-1])
+
+    if len(resultados) > 1:
+        print("\n" + "=" * 80)
+        print(f"{'compras':>12}{'tiempo':>12}{'filas/s':>12}{'docs/s':>12}{'RSS MB':>10}")
+        for r in resultados:
+            filas = sum(e['filas'] for e in r['etapas'])
+            documentos = sum(e['documentos'] for e in r['etapas'])
+            print(f"{r['compras']:>12,}{r['segundos']:>11.2f}s{filas / r['segundos']:>12,.0f}"
+                  f"{documentos / r['segundos']:>12,.0f}{r['rss_pico_mb']:>10,.0f}")
+    if opciones['--salida']:
+        with open(opciones['--salida'], 'w', encoding='utf-8') as archivo:
+            json.dump(resultados, archivo, ensure_ascii=False, indent=2)
+        print(f"\n📈 Resultados: {opciones['--salida']}")
@@ -0,0 +1,151 @@
+"""
+Benchmark de transformar_ventas de migracion_automatica.py
+Compara los joins hash (indexar/agrupar) con la versión anterior de
+búsquedas anidadas, sobre datos sintéticos en memoria (sin MySQL).
+
+La versión anterior se reproduce con el mismo código de transformación
+sustituyendo los índices por tablas que recorren la lista completa en cada
+búsqueda, igual que los next(...) y list comprehensions originales.
+Su coste es cuadrático: por encima de MAXIMO_ANIDADO ventas no se ejecuta y
+se estima a partir de la mayor medición real.
+
+Uso: python benchmark_migracion_automatica.py [ventas ...] [--maximo-anidado N]
+"""
+
+import sys
+import time
+import random
+from datetime import datetime, timedelta
+from unittest import mock
+
+import migracion_automatica as ma
+
+TAMANOS = [10_000, 100_000, 1_000_000]
+MAXIMO_ANIDADO = 10_000
+
+# ============================================================================
+# VERSIÓN ANTERIOR (búsquedas lineales)
+# ============================================================================
+
+class PrimeraLineal:
+    """Equivale a next((f for f in filas if f[clave] == valor), None)"""
+    def __init__(self, filas, clave):
+        self.filas, self.clave = filas, clave
+
+    def get(self, valor, defecto=None):
+        return next((f for f in self.filas if f[self.clave] == valor), defecto)
+
+class GrupoLineal(PrimeraLineal):
+    """Equivale a [f for f in filas if f[clave] == valor]"""
+    def get(self, valor, defecto=None):
+        return [f for f in self.filas if f[self.clave] == valor]
+
+# ============================================================================
+# DATOS SINTÉTICOS
+# ============================================================================
+
+def generar_datos(ventas, semilla=7):
+    """Tablas de una óptica con `ventas` compras y 1-4 detalles por compra"""
+    rnd = random.Random(semilla)
+    inicio = datetime(2023, 1, 1)
+    productos = [
+        {'id_producto': i, 'nombre_producto': f'Producto {i}', 'codigo_barras': f'770{i:09d}'}
+        for i in range(1, 2001)
+    ]
+    metodos = [
+        {'id_metodo': i, 'nombre_metodo': nombre, 'activo': 1}
+        for i, nombre in enumerate(['Efectivo', 'Tarjeta', 'Transferencia', 'Nequi', 'Daviplata'], 1)
+    ]
+    compras, detalles, facturas = [], [], []
+    for id_compra in range(1, ventas + 1):
+        total = 0.0
+        for _ in range(rnd.randint(1, 4)):
+            cantidad = rnd.randint(1, 3)
+            precio = float(rnd.randint(20, 400) * 1000)
+            total += cantidad * precio
+            detalles.append({
+                'id_compra': id_compra, 'id_producto': rnd.randint(1, 2000),
+                'cantidad': cantidad, 'precio_unitario': precio,
+                'subtotal': cantidad * precio, 'descuento': 0.0, 'total': cantidad * precio
+            })
+        compras.append({
+            'id_compra': id_compra, 'id_metodo': rnd.randint(1, 5),
+            'id_cliente': rnd.randint(1, max(ventas // 10, 1)), 'id_asesor': rnd.randint(1, 50),
+            'fecha_compra': inicio + timedelta(minutes=id_compra),
+            'subtotal': total, 'descuento': 0.0, 'impuesto': total * 0.19,
+            'total': total * 1.19, 'estado': 'Completada', 'observaciones': ''
+        })
+        if rnd.random() < 0.9:
+            facturas.append({'id_compra': id_compra, 'numero_factura': f'FAC-{id_compra:08d}'})
+    # El orden de las tablas hijas no coincide con el de las compras
+    rnd.shuffle(detalles)
+    rnd.shuffle(facturas)
+    return {
+        'Compra': compras, 'DetalleCompra': detalles, 'Factura': facturas,
+        'MetodoPago': metodos, 'Producto': productos
+    }
+
+# ============================================================================
+# MEDICIÓN
+# ============================================================================
+
+def transformar(datos, anidado=False):
+    """Ejecuta transformar_ventas sobre `datos`; devuelve (documentos, segundos)"""
+    sustitutos = {'extraer_tabla': lambda conexion, tabla: datos[tabla]}
+    if anidado:
+        sustitutos.update(indexar=PrimeraLineal, agrupar=GrupoLineal)
+    # Las funciones de ma se restauran al salir, también si la transformación falla
+    with mock.patch.multiple(ma, **sustitutos):
+        inicio = time.perf_counter()
+        documentos = ma.transformar_ventas(None, {}, {}, {})
+        return documentos, time.perf_counter() - inicio
+
+def sin_ids(documentos):
+    """Documentos sin _id (ObjectId aleatorio) para compararlos"""
+    return [{k: v for k, v in doc.items() if k != '_id'} for doc in documentos]
+
+if __name__ == "__main__":
+    argumentos = sys.argv[1:]
+    if '--maximo-anidado' in argumentos:
+        posicion = argumentos.index('--maximo-anidado')
+        MAXIMO_ANIDADO = int(argumentos[posicion + 1])
+        del argumentos[posicion:posicion + 2]
+    tamanos = [int(a) for a in argumentos] or TAMANOS
+
+    resultados = []
+    referencia = None  # (ventas, segundos) de la mayor ejecución anidada real
+    for ventas in tamanos:
+        print("=" * 80)
+        print(f"📦 Generando {ventas:,} ventas sintéticas...")
+        datos = generar_datos(ventas)
+
+        hash_docs, hash_seg = transformar(datos)
+        if ventas <= MAXIMO_ANIDADO:
+            anidado_docs, anidado_seg = transformar(datos, anidado=True)
+            if sin_ids(anidado_docs) != sin_ids(hash_docs):
+                print("❌ Las dos versiones producen documentos distintos")
+                sys.exit(1)
+            print("✅ Documentos idénticos en ambas versiones")
+            referencia = (ventas, anidado_seg)
+            estimado = False
+        elif referencia:
+            anidado_seg = referencia[1] * (ventas / referencia[0]) ** 2
+            estimado = True
+        else:
+            anidado_seg, estimado = None, True
+        resultados.append((ventas, anidado_seg, estimado, hash_seg))
+        del datos, hash_docs
+
+    print("\n" + "=" * 80)
+    print("⏱️  TRANSFORMAR VENTAS: búsquedas anidadas vs joins hash")
+    print("=" * 80)
+    print(f"{'ventas':>12}{'anidado':>18}{'hash join':>14}{'speedup':>12}")
+    for ventas, anidado_seg, estimado, hash_seg in resultados:
+        if anidado_seg is None:
+            print(f"{ventas:>12,}{'—':>18}{hash_seg:>12.2f} s{'—':>12}")
+            continue
+        marca = '≈' if estimado else ' '
+        print(f"{ventas:>12,}{marca:>4}{anidado_seg:>12.2f} s{hash_seg:>12.2f} s{anidado_seg / hash_seg:>11.0f}x")
+    if any(estimado for _, _, estimado, _ in resultados):
+        print(f"\n≈ estimado (coste cuadrático) a partir de la mayor medición real; "
+              f"la versión anidada solo se ejecuta hasta {MAXIMO_ANIDADO:,} ventas")
@@ -0,0 +1,70 @@
+"""
+Benchmark de memoria de las transformaciones de migracion_mysql_a_mongodb.py
+Transforma una partición de documentos de citas, productos y ventas sobre
+la base SQLite sintética de benchmark_migracion.py (sin MySQL ni MongoDB) y
+mide lo que una partición retiene hasta la carga: memoria y bloques vivos
+por documento (tracemalloc), bytes del pickle que viaja del proceso de la
+partición al principal, y tiempo de transformación (en una pasada aparte
+sin tracemalloc, que multiplica el costo de cada asignación).
+
+Para comparar dos versiones del migrador, ejecutar el script en cada una
+con los mismos argumentos (la base generada se reutiliza).
+
+Uso: python benchmark_transformaciones.py [compras] [--datos DIR]
+"""
+
+import sys
+import time
+import pickle
+import tracemalloc
+
+import migracion_mysql_a_mongodb as migracion
+from benchmark_migracion import ConexionSQLite, preparar_base, DATOS
+
+COMPRAS = 100_000
+ETAPAS = ('citas', 'productos', 'ventas')
+
+def transformar(conexion, nombre):
+    """Documentos de la etapa en una lista, como los pares de una partición"""
+    etapa = migracion.ETAPAS[nombre]
+    # Mapas sin estado: resuelven cualquier referencia sin ejecutar las dependencias
+    dependencias = [migracion.MapaIdsDeterminista(migracion.ETAPAS[d].tabla) for d in etapa.dependencias]
+    id_map = migracion.MapaIdsDeterminista(etapa.tabla)
+    return list(etapa.transformar(conexion, *dependencias, id_map))
+
+def medir(ruta, nombre):
+    conexion = ConexionSQLite(ruta)
+    try:
+        inicio = time.perf_counter()
+        transformar(conexion, nombre)
+        segundos = time.perf_counter() - inicio
+        # Los catálogos e índices de la caché de la transformación se liberan
+        # al terminar: lo retenido son los documentos
+        tracemalloc.start()
+        documentos = transformar(conexion, nombre)
+        memoria, _ = tracemalloc.get_traced_memory()
+        bloques = sum(e.count for e in tracemalloc.take_snapshot().statistics('filename'))
+        tracemalloc.stop()
+    finally:
+        conexion.close()
+    serializado = len(pickle.dumps(documentos, protocol=pickle.HIGHEST_PROTOCOL))
+    cantidad = len(documentos) or 1
+    print(f"{nombre:<12}{len(documentos):>10,}{memoria / 1024 / 1024:>10.1f} MB{memoria / cantidad:>9,.0f} B"
+          f"{bloques / cantidad:>9.1f}{serializado / 1024 / 1024:>10.1f} MB{segundos:>9.2f} s")
+
+if __name__ == "__main__":
+    argumentos = sys.argv[1:]
+    datos = DATOS
+    if '--datos' in argumentos:
+        posicion = argumentos.index('--datos')
+        datos = argumentos[posicion + 1]
+        del argumentos[posicion:posicion + 2]
+    compras = int(argumentos[0]) if argumentos else COMPRAS
+    ruta = preparar_base(compras, datos)
+
+    print("=" * 80)
+    print(f"🧪 TRANSFORMACIONES: base de {compras:,} compras")
+    print("=" * 80)
+    print(f"{'etapa':<12}{'docs':>10}{'retenido':>13}{'por doc':>11}{'bloques':>9}{'pickle':>13}{'tiempo':>11}")
+    for nombre in ETAPAS:
+        medir(ruta, nombre)
@@ -22,6 +22,7 @@ from datetime import datetime
 from bson.objectid import ObjectId
 import os
 from dotenv import load_dotenv
+from migracion_mysql_a_mongodb import indexar, agrupar
 
 # Cargar variables de entorno
 load_dotenv()
@@ -81,6 +82,14 @@ def extraer_tabla(mysql_conn, tabla):
     cursor.close()
     return datos
 
+# ============================================================================
+# FUNCIONES DE JOIN (índices hash)
+# ============================================================================
+# Cada tabla se indexa una vez por su clave y cada embed o búsqueda es un
+# acceso al dict: O(padres + hijos) en lugar de recorrer la tabla hija
+# completa por cada padre. indexar y agrupar son las de
+# migracion_mysql_a_mongodb.py.
+
 # ============================================================================
 # FUNCIONES DE TRANSFORMACIÓN
 # ============================================================================
@@ -93,8 +102,8 @@ def transformar_clientes(mysql_conn):
     print("\n🔄 Transformando clientes...")
     
     clientes = extraer_tabla(mysql_conn, 'Cliente')
-    direcciones = extraer_tabla(mysql_conn, 'DireccionCliente')
-    telefonos = extraer_tabla(mysql_conn, 'TelefonoCliente')
+    direcciones = agrupar(extraer_tabla(mysql_conn, 'DireccionCliente'), 'id_cliente')
+    telefonos = agrupar(extraer_tabla(mysql_conn, 'TelefonoCliente'), 'id_cliente')
     
     # Mapeo de IDs MySQL → ObjectId MongoDB
     id_map = {}
@@ -116,7 +125,7 @@ def transformar_clientes(mysql_conn):
                 'pais': d.get('pais', 'Colombia'),
                 'es_principal': d.get('es_principal', False)
             }
-            for d in direcciones if d['id_cliente'] == cliente['id_cliente']
+            for d in direcciones.get(cliente['id_cliente'], [])
         ]
         
         # Filtrar teléfonos del cliente
@@ -126,7 +135,7 @@ def transformar_clientes(mysql_conn):
                 'tipo': t.get('tipo_telefono', 'Móvil'),
                 'es_principal': t.get('es_principal', False)
             }
-            for t in telefonos if t['id_cliente'] == cliente['id_cliente']
+            for t in telefonos.get(cliente['id_cliente'], [])
         ]
         
         # Documento MongoDB
@@ -159,8 +168,8 @@ def transformar_asesores(mysql_conn):
     print("\n🔄 Transformando asesores...")
     
     asesores = extraer_tabla(mysql_conn, 'Asesor')
-    telefonos = extraer_tabla(mysql_conn, 'TelefonoAsesor')
-    emails = extraer_tabla(mysql_conn, 'EmailAsesor')
+    telefonos = agrupar(extraer_tabla(mysql_conn, 'TelefonoAsesor'), 'id_asesor')
+    emails = agrupar(extraer_tabla(mysql_conn, 'EmailAsesor'), 'id_asesor')
     
     id_map = {}
     asesores_mongo = []
@@ -171,12 +180,12 @@ def transformar_asesores(mysql_conn):
         
         tels = [
             {'numero': t['telefono'], 'tipo': t.get('tipo_telefono', 'Móvil')}
-            for t in telefonos if t['id_asesor'] == asesor['id_asesor']
+            for t in telefonos.get(asesor['id_asesor'], [])
         ]
         
         mails = [
             {'email': e['email'], 'tipo': e.get('tipo_email', 'Corporativo')}
-            for e in emails if e['id_asesor'] == asesor['id_asesor']
+            for e in emails.get(asesor['id_asesor'], [])
         ]
         
         doc_mongo = {
@@ -203,10 +212,10 @@ def transformar_especialistas(mysql_conn):
     print("\n🔄 Transformando especialistas...")
     
     especialistas = extraer_tabla(mysql_conn, 'Especialista')
-    esp_especialidad = extraer_tabla(mysql_conn, 'EspecialistaEspecialidad')
-    especialidades = extraer_tabla(mysql_conn, 'Especialidad')
-    telefonos = extraer_tabla(mysql_conn, 'TelefonoEspecialista')
-    emails = extraer_tabla(mysql_conn, 'EmailEspecialista')
+    esp_especialidad = agrupar(extraer_tabla(mysql_conn, 'EspecialistaEspecialidad'), 'id_especialista')
+    especialidades = indexar(extraer_tabla(mysql_conn, 'Especialidad'), 'id_especialidad')
+    telefonos = agrupar(extraer_tabla(mysql_conn, 'TelefonoEspecialista'), 'id_especialista')
+    emails = agrupar(extraer_tabla(mysql_conn, 'EmailEspecialista'), 'id_especialista')
     
     id_map = {}
     especialistas_mongo = []
@@ -216,31 +225,24 @@ def transformar_especialistas(mysql_conn):
         id_map[esp['id_especialista']] = mongo_id
         
         # Obtener especialidades del especialista
-        ids_esp = [
-            ee['id_especialidad'] 
-            for ee in esp_especialidad 
-            if ee['id_especialista'] == esp['id_especialista']
-        ]
-        
         especialidades_doc = []
-        for ee in esp_especialidad:
-            if ee['id_especialista'] == esp['id_especialista']:
-                esp_info = next((e for e in especialidades if e['id_especialidad'] == ee['id_especialidad']), None)
-                if esp_info:
-                    especialidades_doc.append({
-                        'nombre': esp_info['nombre_especialidad'],
-                        'descripcion': esp_info.get('descripcion', ''),
-                        'fecha_certificacion': ee.get('fecha_certificacion')
-                    })
+        for ee in esp_especialidad.get(esp['id_especialista'], []):
+            esp_info = especialidades.get(ee['id_especialidad'])
+            if esp_info:
+                especialidades_doc.append({
+                    'nombre': esp_info['nombre_especialidad'],
+                    'descripcion': esp_info.get('descripcion', ''),
+                    'fecha_certificacion': ee.get('fecha_certificacion')
+                })
         
         tels = [
             {'numero': t['telefono'], 'tipo': t.get('tipo_telefono', 'Móvil')}
-            for t in telefonos if t['id_especialista'] == esp['id_especialista']
+            for t in telefonos.get(esp['id_especialista'], [])
         ]
         
         mails = [
             {'email': e['email'], 'tipo': e.get('tipo_email', 'Profesional')}
-            for e in emails if e['id_especialista'] == esp['id_especialista']
+            for e in emails.get(esp['id_especialista'], [])
         ]
         
         doc_mongo = {
@@ -268,7 +270,7 @@ def transformar_productos(mysql_conn, suministros_map):
     print("\n🔄 Transformando productos...")
     
     productos = extraer_tabla(mysql_conn, 'Producto')
-    tipos = extraer_tabla(mysql_conn, 'TipoProducto')
+    tipos = indexar(extraer_tabla(mysql_conn, 'TipoProducto'), 'id_tipo')
     
     id_map = {}
     productos_mongo = []
@@ -278,7 +280,7 @@ def transformar_productos(mysql_conn, suministros_map):
         id_map[prod['id_producto']] = mongo_id
         
         # Buscar tipo
-        tipo_info = next((t for t in tipos if t['id_tipo'] == prod['id_tipo']), None)
+        tipo_info = tipos.get(prod['id_tipo'])
         
         doc_mongo = {
             '_id': mongo_id,
@@ -313,10 +315,10 @@ def transformar_ventas(mysql_conn, clientes_map, asesores_map, productos_map):
     print("\n🔄 Transformando ventas...")
     
     compras = extraer_tabla(mysql_conn, 'Compra')
-    detalles = extraer_tabla(mysql_conn, 'DetalleCompra')
-    facturas = extraer_tabla(mysql_conn, 'Factura')
-    metodos = extraer_tabla(mysql_conn, 'MetodoPago')
-    productos = extraer_tabla(mysql_conn, 'Producto')
+    detalles = agrupar(extraer_tabla(mysql_conn, 'DetalleCompra'), 'id_compra')
+    facturas = indexar(extraer_tabla(mysql_conn, 'Factura'), 'id_compra')
+    metodos = indexar(extraer_tabla(mysql_conn, 'MetodoPago'), 'id_metodo')
+    productos = indexar(extraer_tabla(mysql_conn, 'Producto'), 'id_producto')
     
     ventas_mongo = []
     
@@ -324,17 +326,17 @@ def transformar_ventas(mysql_conn, clientes_map, asesores_map, productos_map):
         mongo_id = ObjectId()
         
         # Buscar método de pago
-        metodo = next((m for m in metodos if m['id_metodo'] == compra['id_metodo']), None)
+        metodo = metodos.get(compra['id_metodo'])
         
         # Buscar factura
-        factura = next((f for f in facturas if f['id_compra'] == compra['id_compra']), None)
+        factura = facturas.get(compra['id_compra'])
         
         # Buscar items
-        items_compra = [d for d in detalles if d['id_compra'] == compra['id_compra']]
+        items_compra = detalles.get(compra['id_compra'], [])
         
         items_mongo = []
         for item in items_compra:
-            prod = next((p for p in productos if p['id_producto'] == item['id_producto']), None)
+            prod = productos.get(item['id_producto'])
             items_mongo.append({
                 'producto_ref': productos_map.get(item['id_producto']),
                 'producto_info': {
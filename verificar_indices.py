@@ -20,7 +20,8 @@ client = MongoClient(MONGODB_URI)
 db = client[MONGODB_DATABASE]
 
 colecciones = ['catalogos', 'clientes', 'asesores', 'especialistas', 'proveedores', 
-               'laboratorios', 'suministros', 'productos', 'citas', 'examenes', 'ventas']
+               'laboratorios', 'suministros', 'productos', 'citas', 'examenes', 'ventas',
+               'devoluciones']
 
 print(f"✅ Conectado a: {MONGODB_DATABASE}\n")
 
@@ -63,7 +64,8 @@ esperados = {
     'productos': 10,
     'citas': 9,
     'examenes': 8,
-    'ventas': 11
+    'ventas': 11,
+    'devoluciones': 4
 }
 
 print("\n📊 COMPARACIÓN CON ÍNDICES ESPERADOS:\n")